@@ -1,6 +1,31 @@
+from __future__ import annotations
+
+import io
+import re
+from dataclasses import dataclass, field
+from itertools import repeat
+
 import numpy as np
 import pandas as pd
 
+try:
+    from numba import njit
+except ImportError:  # numba is an optional accelerator
+
+    def njit(*args, **kwargs):
+        """Fallback decorator used when numba is not installed."""
+
+        def decorator(func):
+            return func
+
+        return decorator
+
+
+# "name = value" pairs of the parameter block, units such as ° or m/s are skipped
+_PARAMETER_RE = re.compile(
+    r"([^\s=]+)\s*=\s*([-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?)"
+)
+
 
 class OpPoint:
     def __init__(self):
@@ -11,39 +36,36 @@ class OpPoint:
             lines = f.readlines()
 
         # Store every index of empty lines
-        sep = [i for i, line in enumerate(lines) if line == "\n"]
+        is_empty = np.fromiter(
+            map(str.__eq__, lines, repeat("\n")), dtype=bool, count=len(lines)
+        )
+        sep = np.flatnonzero(is_empty).tolist()
         # Well use this names as defaults to identify diferent sets of distributions:
         # WARNING: The code will fail if the dafult names were modified.
-        table_names = ["Main Wing", "Elevator", "Fin", "Second Wing2"]
+        table_names = frozenset(("Main Wing", "Elevator", "Fin", "Second Wing2"))
 
         # Read all the file parameters
         param_lines = lines[sep[0] + 1 : sep[1]]
         self.plane = param_lines[0].rstrip()
-        parameters = {}
-        for line in param_lines:
-            parts = line.rstrip().replace("°", "").split()
-
-            for i, part in enumerate(parts):
-                if part == "=":
-                    parameters[parts[i - 1]] = float(parts[i + 1])
+        parameters = {
+            name: float(value)
+            for name, value in _PARAMETER_RE.findall("".join(param_lines))
+        }
         self.v = parameters["QInf"]
         self.alpha = parameters["Alpha"]
         self.beta = parameters["Beta"]
         self.phi = parameters["Phi"]
         self.parameters = parameters
 
-        # Store the beggining line and end of each table in a list to slice
+        # Store the beggining line and end of each table in a list to slice,
+        # tables start with their name right after an empty line.
         intervals = [
             [sep[i] + 1, sep[i + 1]]
             for i in range(len(sep) - 1)
-            if any(
-                [
-                    (line.rstrip("\n") in table_names)
-                    for line in lines[sep[i] : sep[i + 1]]
-                ]
-            )
+            if lines[sep[i] + 1].rstrip("\n") in table_names
         ]
 
+        distributions = []
         for interval in intervals:
             # Slice file
             table_lines = lines[interval[0] : interval[1]]
@@ -51,39 +73,176 @@ class OpPoint:
             name = table_lines.pop(0).rstrip("\n")
             # headers
             headers = table_lines.pop(0).split()
-            data_lines = table_lines
-            data = np.array([[float(n) for n in line.split()] for line in data_lines])
-            df_OpPoint = pd.DataFrame(data, columns=headers)
-            distribution = SpanDistribution(name, df_OpPoint)
-            distribution.calculate_forces(v=self.v, alpha=self.alpha)
+            # Parse the numeric block in a single C-level pass
+            data = np.loadtxt(io.StringIO("".join(table_lines)), ndmin=2)
+            if len(headers) != data.shape[1]:
+                raise ValueError(
+                    f"{name}: {len(headers)} headers for {data.shape[1]} columns"
+                )
+            # Column-major copy so every column is a contiguous array
+            columns = np.ascontiguousarray(data.T)
+            distributions.append(
+                SpanDistribution.from_columns(name, dict(zip(headers, columns)))
+            )
 
+        # All surfaces share the flight condition, solve them in one kernel call
+        calculate_distribution_forces(distributions, v=self.v, alpha=self.alpha)
+        for distribution in distributions:
             self.add_distribution(distribution)
 
     def add_distribution(self, distribution):
         self.distributions.append(distribution)
 
 
+@dataclass(repr=False, eq=False)
 class SpanDistribution:
-    def __init__(self, name, df):
-        self.name = name
-        self.df = df
+    """Spanwise aerodynamic distribution of a surface, stored as column arrays."""
+
+    name: str
+    y: np.ndarray
+    chord: np.ndarray
+    cl: np.ndarray
+    pcd: np.ndarray
+    icd: np.ndarray
+    # Remaining columns of the XFLR5 table, keyed by their header
+    extra: dict[str, np.ndarray] = field(default_factory=dict)
+    # Column order of the XFLR5 table
+    headers: list[str] = field(default_factory=list)
+    # Strip forces, available after calculate_forces
+    dy: np.ndarray | None = None
+    dA: np.ndarray | None = None
+    cd: np.ndarray | None = None
+    dL: np.ndarray | None = None
+    dD: np.ndarray | None = None
+    dM: np.ndarray | None = None
+
+    @classmethod
+    def from_columns(
+        cls, name: str, columns: dict[str, np.ndarray]
+    ) -> SpanDistribution:
+        """Creates a distribution from the columns of an XFLR5 table."""
+        columns = dict(columns)
+        headers = list(columns)
+        return cls(
+            name=name,
+            y=columns.pop("y-span"),
+            chord=columns.pop("Chord"),
+            cl=columns.pop("Cl"),
+            pcd=columns.pop("PCd"),
+            icd=columns.pop("ICd"),
+            extra=columns,
+            headers=headers,
+        )
+
+    @property
+    def df(self) -> pd.DataFrame:
+        """Returns the distribution as a dataframe for inspection and export."""
+        table = {
+            "y-span": self.y,
+            "Chord": self.chord,
+            "Cl": self.cl,
+            "PCd": self.pcd,
+            "ICd": self.icd,
+            **self.extra,
+        }
+        columns = {header: table[header] for header in self.headers or table}
+        if self.dy is not None:
+            columns.update(
+                dy=self.dy, dA=self.dA, Cd=self.cd, dL=self.dL, dD=self.dD, dM=self.dM
+            )
+        return pd.DataFrame(columns)
 
     def __repr__(self):
         return self.name + " spanwise aerodynamic distribution"
 
     def calculate_forces(self, v=16.0, alpha=0, rho=1.225):
+        calculate_distribution_forces([self], v=v, alpha=alpha, rho=rho)
+
+
+def calculate_distribution_forces(
+    distributions: list[SpanDistribution], v=16.0, alpha=0, rho=1.225
+) -> None:
+    """Computes the strip forces of several span distributions at once.
+
+    The columns of all distributions are concatenated and evaluated in a
+    single kernel call, each distribution then keeps views of its positive
+    half of the results.
+    """
+    if not distributions:
+        return
+
+    lengths = np.array([len(distribution.y) for distribution in distributions])
+    starts = np.cumsum(lengths) - lengths
+
+    def stack(attribute: str) -> np.ndarray:
+        return np.concatenate(
+            [getattr(distribution, attribute) for distribution in distributions]
+        )
+
+    mask, *forces = _forces_kernel(
+        stack("y"),
+        stack("chord"),
+        stack("cl"),
+        stack("pcd"),
+        stack("icd"),
+        float(v),
+        float(rho),
+        # An empty distribution has no first station, its start may be out of bounds
+        starts[lengths > 0],
+    )
+
+    # Boundaries of every distribution in the masked result arrays
+    kept = np.concatenate(([0], np.cumsum(mask)))
+    splits = kept[starts[1:]]
+    dy, dA, cd, dL, dD, dM = (np.split(values, splits) for values in forces)
+
+    for i, (distribution, dist_mask) in enumerate(
+        zip(distributions, np.split(mask, starts[1:]))
+    ):
+        distribution.dy = dy[i]
+        distribution.dA = dA[i]
+        distribution.cd = cd[i]
+        distribution.dL = dL[i]
+        distribution.dD = dD[i]
+        distribution.dM = dM[i]
 
-        df = self.df.copy(deep=False)
-        df.loc[:, "dy"] = df["y-span"].diff()
         # Saving the positive part of distirbution
-        dist = df[df["y-span"] >= 0].copy(deep=True)
-        dist["dA"] = dist["dy"] * dist["Chord"]
-        dist["Cd"] = dist["PCd"] + dist["ICd"]
-        # Dynamic Pressure from input parameters
-        q = 0.5 * rho * v**2
-        dist["dL"] = q * dist["dA"] * dist["Cl"]
-        dist["dD"] = q * dist["dA"] * dist["Cd"]
-        # Strip Moment?
-        dist["dM"] = q * dist["dA"] * dist["Chord"]
-
-        self.df = dist
+        distribution.y = distribution.y[dist_mask]
+        distribution.chord = distribution.chord[dist_mask]
+        distribution.cl = distribution.cl[dist_mask]
+        distribution.pcd = distribution.pcd[dist_mask]
+        distribution.icd = distribution.icd[dist_mask]
+        distribution.extra = {
+            name: values[dist_mask] for name, values in distribution.extra.items()
+        }
+
+
+# NaN strip widths are expected, so only FMA contraction is enabled.
+# Set NUMBA_DISABLE_JIT=1 to run the kernel as plain Python/NumPy.
+@njit(cache=True, fastmath={"contract"})
+def _forces_kernel(y, chord, cl, pcd, icd, v, rho, starts):
+    """Computes the strip forces of the positive half of span distributions.
+
+    The inputs hold one or more distributions back to back, starting at the
+    indices in starts. Strip widths are taken over the full span of each
+    distribution before clipping to y >= 0.
+    Returns the mask of kept stations and dy, dA, Cd, dL, dD, dM over them.
+    """
+    dy = np.empty_like(y)
+    dy[1:] = y[1:] - y[:-1]
+    dy[starts] = np.nan
+
+    mask = y >= 0
+    dy = dy[mask]
+    chord = chord[mask]
+
+    dA = dy * chord
+    cd = pcd[mask] + icd[mask]
+    # Dynamic Pressure from input parameters
+    q = 0.5 * rho * v**2
+    dL = q * dA * cl[mask]
+    dD = q * dA * cd
+    # Strip Moment?
+    dM = q * dA * chord
+
+    return mask, dy, dA, cd, dL, dD, dM
@@ -40,30 +40,8 @@ def triangle_normal(v1: np.ndarray, v2: np.ndarray, v3: np.ndarray) -> np.ndarra
 def surface_centroid_area(xx, yy, zz) -> tuple[np.ndarray, float]:
     """Calculates the centroid of a surface using triangulation methods
 
-    Parameters
-    ----------
-    xx : np.ndarray
-        x-matrix of surface coordinates
-    yy : np.ndarray
-        y-matrix of surface coordinates
-    zz : np.ndarray
-        z-matrix of surface coordinates
-    """
-    # Calculate the area of bottom left half surface
-    centroid_l, area_l = _calculate_centroid_of_half_surface(xx, yy, zz)
-    # Calculate the area of top right half surface
-    centroid_r, area_r = _calculate_centroid_of_half_surface(
-        np.flip(xx), np.flip(yy), np.flip(zz)
-    )
-    area = area_l + area_r
-
-    centroid = (centroid_l * area_l + centroid_r * area_r) / area
-
-    return centroid, area
-
-
-def _calculate_centroid_of_half_surface(xx, yy, zz) -> tuple[np.ndarray, float]:
-    """Calculates the centroid of a surface using triangulation methods
+    Every quad of the grid is split into two triangles, the area of each
+    triangle is 0.5 * ||(b - a) x (c - a)|| and its centroid (a + b + c) / 3.
 
     Parameters
     ----------
@@ -74,70 +52,25 @@ def _calculate_centroid_of_half_surface(xx, yy, zz) -> tuple[np.ndarray, float]:
     zz : np.ndarray
         z-matrix of surface coordinates
     """
+    points = np.stack([xx, yy, zz], axis=-1)
 
-    coordinates = np.array([xx, yy, zz])
+    bottom_left = points[:-1, :-1].reshape(-1, 3)
+    bottom_right = points[:-1, 1:].reshape(-1, 3)
+    upper_left = points[1:, :-1].reshape(-1, 3)
+    upper_right = points[1:, 1:].reshape(-1, 3)
 
-    triangles_coordinates = np.array(
-        [
-            coordinates[:, :-1, :-1],  # bottom left vertices -> 0
-            coordinates[:, :-1, 1:],  # bottom right vertices -> 1
-            coordinates[:, 1:, :-1],  # upper left vertices -> 2
-        ]
-    )
-    # to acces the triangle associated with the first vertex
-    # use: triangle_coordinates[:, 0, 0]
-
-    area_matrix = _calculate_area_of_half_surface(xx, yy, zz)
+    # (N, 3) vertices of the lower left and upper right triangles of each quad
+    v1 = np.concatenate([bottom_left, upper_right])
+    v2 = np.concatenate([bottom_right, upper_left])
+    v3 = np.concatenate([upper_left, bottom_right])
 
-    centroids = np.mean(triangles_coordinates, axis=0)
-
-    centroid = np.sum(np.sum(area_matrix * centroids, axis=1), axis=1) / np.sum(
-        area_matrix
-    )
+    areas = 0.5 * np.linalg.norm(np.cross(v2 - v1, v3 - v1), axis=1)
+    centroids = (v1 + v2 + v3) / 3.0
 
-    return centroid, np.sum(area_matrix)
+    area = np.sum(areas)
+    centroid = areas @ centroids / area
 
-
-def _calculate_area_of_half_surface(
-    xx: np.ndarray, yy: np.ndarray, zz: np.ndarray
-) -> np.ndarray:
-    """Calculates the area of surface triangles (bottom half) and reurns the
-    array of each triangle formed by
-    triangle[0,0] -> (vertex[0,0], vertex[1,0], vertex[0,1])
-    area[0,0] -> area(triangle[0,0])
-
-
-
-    Parameters
-    ----------
-    xx : np.ndarray
-        _description_
-    yy : np.ndarray
-        _description_
-    zz : np.ndarray
-        _description_
-
-    Returns
-    -------
-    np.ndarray
-        Area matrix of the input vertices dimensions are (n-1), (m-1) of input shape.
-    """
-
-    # Calculate the vectors for two sides of each small triangle
-    # This calculates only half of the surface
-    vec_v = np.array(
-        [np.diff(xx, axis=0), np.diff(yy, axis=0), np.diff(zz, axis=0)]
-    ).transpose(1, 2, 0)
-    vec_u = np.array(
-        [np.diff(xx, axis=1), np.diff(yy, axis=1), np.diff(zz, axis=1)]
-    ).transpose(1, 2, 0)
-
-    # Calculate the cross product, which gives a vector perpendicular to the triangle's surface
-    # The magnitude of this vector is twice the area of the triangle
-    cross_product = np.cross(vec_u[:-1, :], vec_v[:, :-1], axis=2)
-    areas = np.linalg.norm(cross_product, axis=2)
-
-    return areas / 2
+    return centroid, area
 
 
 def evaluate_surface_intersection(
@@ -28,6 +28,8 @@ from src.utils.interpolation import vector_interpolation
 class StructuralRib:
     """
     Represents a structural rib of the aircraft, defined by a curve.
+    The area, centroid and mass are cached, the rib is not expected to
+    change after construction.
     """
 
     curve: GeometricCurve
@@ -41,17 +43,17 @@ class StructuralRib:
         self.thickness = thickness
         self.material = material
 
-    @property
+    @cached_property
     def area(self) -> float:
         """Calculate the area of the rib."""
         return self.curve.area
 
-    @property
+    @cached_property
     def centroid(self) -> SpatialArray:
         """Calculate the centroid of the rib."""
         return self.curve.centroid
 
-    @property
+    @cached_property
     def mass(self) -> PointMass:
         """Returns the computed mass of the rib.
         Returns: float, units: kg
@@ -110,7 +112,8 @@ class StructuralRib:
 
 class SurfaceCoating:
     """Represents the surface coating (Monokote).
-    Uses SI units only."""
+    Uses SI units only. The centroid, area and mass are cached, the coating
+    is not expected to change after construction."""
 
     surface: GeometricSurface
     thickness: float
@@ -161,7 +164,7 @@ class SurfaceCoating:
         _, area = self._centroid_area
         return area
 
-    @property
+    @cached_property
     def mass(self) -> PointMass:
         """Returns the computed mass of the coating.
         Returns: float, units: kg
@@ -246,12 +249,15 @@ class SurfaceStructure:
 
     def add_spar(self, spar: StructuralSpar):
         self.spars.append(spar)
+        self.__dict__.pop("mass", None)
 
     def add_rib(self, rib: StructuralRib):
         self.ribs.append(rib)
+        self.__dict__.pop("mass", None)
 
     def add_coating(self, coating: SurfaceCoating):
         self.coatings.append(coating)
+        self.__dict__.pop("mass", None)
 
     @staticmethod
     def calculate_ribs(
@@ -265,17 +271,26 @@ class SurfaceStructure:
         # Implementation of rib calculation and interpolation goes here
         wingspans = surface.wingspans
         # Number of ribs between sections
-        n_ribs = np.ceil((wingspans[1:] - wingspans[:-1]) / max_spacing)
+        deltas = np.diff(wingspans)
+        n_ribs = np.ceil(deltas / max_spacing).astype(int)
 
-        # Ensures the original positions of the sections are maintained.
-        section_ribs = [
-            np.linspace(wingspans[i], wingspans[i + 1], int(n + 1))
-            for i, n in enumerate(n_ribs)
-        ]
+        # Evenly spaced positions within each section, same as np.linspace
+        # without the endpoint, generated for all sections at once.
+        steps = deltas / np.maximum(n_ribs, 1)
+        offsets = np.cumsum(n_ribs) - n_ribs
+        k = np.arange(n_ribs.sum()) - np.repeat(offsets, n_ribs)
+        positions = k * np.repeat(steps, n_ribs) + np.repeat(wingspans[:-1], n_ribs)
 
-        rib_positions = np.unique(np.concatenate(section_ribs))
+        # Ensures the original positions of the sections are maintained.
+        rib_positions = np.unique(np.append(positions, wingspans[-1]))
 
-        section_curves = np.array([curve.data for curve in surface.curves])
+        # Copy the section curves into a preallocated C-contiguous block
+        curves = surface.curves
+        section_curves = np.empty(
+            (len(curves), *curves[0].data.shape), dtype=np.float64
+        )
+        for i, curve in enumerate(curves):
+            section_curves[i] = curve.data
 
         ribs_geometry = vector_interpolation(rib_positions, wingspans, section_curves)
 
@@ -315,10 +330,11 @@ class SurfaceStructure:
         print(compute_mass_center(collect(self.spars), tag="Spars"))
         print(compute_mass_center(collect(self.ribs), tag="Ribs"))
         print(compute_mass_center(collect(self.coatings), tag="Coatings"))
+        total = self.mass
         print(
-            compute_mass_center(self.collect_masses(), tag="Total " + self.surface.name)
+            PointMass(total.mass, total.coordinates, tag="Total " + self.surface.name)
         )
-        return compute_mass_center(self.collect_masses(), tag=self.surface.name)
+        return total
 
     def summary_data(self) -> list[dict]:
         """Generates summary weight data of properties:
@@ -337,14 +353,15 @@ class SurfaceStructure:
 
         return properties
 
-    @property
+    @cached_property
     def mass(self) -> PointMass:
-        """_summary_
+        """Returns the total mass and center of mass of the structure.
+        Cached until a component is added through add_spar/add_rib/add_coating.
 
         Returns
         -------
         PointMass
-            _description_
+            Center of Mass of the structure components.
         """
         return compute_mass_center(self.collect_masses(), tag=self.surface.name)
 
@@ -517,17 +534,21 @@ def compute_mass_center(point_masses: Iterable[PointMass], tag="") -> PointMass:
         Center of Mass of the point masses.
     """
 
-    point_masses = tuple(point_masses)
+    point_masses = list(point_masses)
 
-    weighted_coordinates = np.array(
-        [point_mass.mass * point_mass.coordinates for point_mass in point_masses]
+    # Single gather of the masses and coordinates, then a vectorized reduction
+    masses = np.fromiter(
+        (point_mass.mass for point_mass in point_masses),
+        dtype=np.float64,
+        count=len(point_masses),
+    )
+    coordinates = np.array(
+        [point_mass.coordinates for point_mass in point_masses], dtype=np.float64
     )
 
-    weighted_coordinates = np.sum(weighted_coordinates, axis=0)
-
-    total_mass = sum(point_mass.mass for point_mass in point_masses)
+    total_mass = masses.sum()
 
-    coordinates = weighted_coordinates / total_mass
+    coordinates = masses @ coordinates / total_mass
 
     return PointMass(total_mass, SpatialArray(coordinates), tag=tag)
 
@@ -1,7 +1,10 @@
 """Module containing helper XML Parsing functions."""
 
+import math
 import xml.etree.ElementTree as ET
-from typing import Union
+from collections.abc import Callable, Iterator
+from itertools import count
+from typing import Any, Union
 
 
 def parse_xml_to_dict(element: ET.Element) -> dict:
@@ -16,7 +19,7 @@ def parse_xml_to_dict(element: ET.Element) -> dict:
                         XML element, including attributes.
     """
     # Handle base case with no children; consider element text and attributes
-    if not list(element) and not element.attrib:
+    if len(element) == 0 and not element.attrib:
         return parse_type(element.text)  # type: ignore
 
     # Initialize a dictionary to hold child elements and attributes
@@ -46,20 +49,213 @@ def parse_xml_to_dict(element: ET.Element) -> dict:
     return return_dict
 
 
-def parse_xml_file(file_path: str) -> dict:
+def parse_xml_file(file_path: str, specialize: bool = False) -> dict:
     """
     Parse an XML file and return a dictionary representation.
 
+    With specialize=True the tree is parsed with the compiled parser
+    of its schema (see parse_xml_with_schema).
+
     Args:
     file_path (str): The file path to the XML file.
+    specialize (bool): Use the compiled schema parser, useful when
+                       files sharing a schema are loaded repeatedly.
 
     Returns:
     Dict[str, Any]: A dictionary representation of the XML file.
     """
     xml_tree = ET.parse(file_path).getroot()
+    if specialize:
+        return parse_xml_with_schema(xml_tree)
     return parse_xml_to_dict(xml_tree)
 
 
+class SchemaMismatch(Exception):
+    """Raised when an element does not follow the compiled schema"""
+
+
+# Compiled parsers of the schemas seen for each root tag
+_SCHEMA_PARSERS: dict[str, list[Callable[[ET.Element], Any]]] = {}
+# Signatures of the schemas seen once for each root tag, not compiled yet
+_SEEN_SCHEMAS: dict[str, set[int]] = {}
+# Schemas compiled per root tag, further variants use the generic parser
+_MAX_SCHEMAS_PER_TAG = 4
+
+
+def parse_xml_with_schema(element: ET.Element) -> Any:
+    """
+    Parse an XML element with the compiled parser of its schema.
+
+    Each root tag keeps the parsers of the schemas seen with it. An element
+    that matches none of them is parsed with parse_xml_to_dict. Compiling
+    costs far more than a generic parse, so a parser is only compiled the
+    second time a schema is seen, while fewer than _MAX_SCHEMAS_PER_TAG
+    are stored.
+
+    Args:
+        element (ET.Element): The root XML element to parse.
+
+    Returns:
+        Dict[str, Any]: The same dictionary as parse_xml_to_dict.
+    """
+    parsers = _SCHEMA_PARSERS.setdefault(element.tag, [])
+    for parser in parsers:
+        try:
+            return parser(element)
+        except SchemaMismatch:
+            continue
+
+    if len(parsers) < _MAX_SCHEMAS_PER_TAG:
+        seen = _SEEN_SCHEMAS.setdefault(element.tag, set())
+        signature = _schema_signature(element)
+        if signature in seen:
+            seen.discard(signature)
+            parsers.append(compile_schema(element))
+        else:
+            seen.add(signature)
+    return parse_xml_to_dict(element)
+
+
+def _schema_signature(element: ET.Element) -> int:
+    """
+    Hash the tag structure checked by the compiled parsers.
+
+    Args:
+        element (ET.Element): The root XML element.
+
+    Returns:
+        int: Hash of the tag, child count and attribute presence of every
+             element in document order.
+    """
+    return hash(tuple((e.tag, len(e), not e.attrib) for e in element.iter()))
+
+
+def compile_schema(example_root: ET.Element) -> Callable[[ET.Element], Any]:
+    """
+    Generate a parser specialized for the tag structure of an example element.
+
+    The tag tree of the example is unrolled into straight-line code which
+    unpacks the children by position and builds the dictionaries directly,
+    skipping the merge and listify branches of parse_xml_to_dict. Every
+    element is checked against the example and SchemaMismatch is raised
+    on any difference.
+
+    Args:
+        example_root (ET.Element): The XML element used as schema.
+
+    Returns:
+        Callable[[ET.Element], Any]: Parser returning the same value as
+                                     parse_xml_to_dict for matching elements.
+    """
+    lines: list[str] = []
+    value = _emit_element(example_root, "e0", lines, count(1))
+    body = "".join(f"    {line}\n" for line in lines)
+    source = f"def _parse(e0):\n{body}    return {value}\n"
+
+    namespace = {"parse_type": parse_type, "SchemaMismatch": SchemaMismatch}
+    code = compile(source, f"<schema {example_root.tag}>", "exec")
+    # The source is generated above, tag names only enter it through repr()
+    exec(code, namespace)  # noqa: S102
+    return namespace["_parse"]
+
+
+def _emit_element(
+    element: ET.Element, var: str, lines: list[str], ids: Iterator[int]
+) -> str:
+    """
+    Append the statements parsing an element to lines.
+
+    Args:
+        element (ET.Element): Example element.
+        var (str): Name of the variable holding the element in the generated code.
+        lines (list[str]): Generated statements.
+        ids (Iterator[int]): Source of unique variable numbers.
+
+    Returns:
+        str: Expression evaluating to the parsed value of the element.
+    """
+    children = list(element)
+    has_attrib = bool(element.attrib)
+
+    if not children and not has_attrib:
+        lines.append(f"if len({var}) or {var}.attrib:")
+        lines.append("    raise SchemaMismatch")
+        return f"parse_type({var}.text)"
+
+    attrib_check = f"not {var}.attrib" if has_attrib else f"{var}.attrib"
+    lines.append(f"if len({var}) != {len(children)} or {attrib_check}:")
+    lines.append("    raise SchemaMismatch")
+
+    child_vars = [f"e{next(ids)}" for _ in children]
+    if children:
+        tags = tuple(child.tag for child in children)
+        lines.append(f"{', '.join(child_vars)}, = {var}")
+        lines.append(f"if ({', '.join(v + '.tag' for v in child_vars)},) != {tags!r}:")
+        lines.append("    raise SchemaMismatch")
+
+    items = []
+    if has_attrib:
+        items.append(
+            f"'@attributes': {{k: parse_type(v) for k, v in {var}.attrib.items()}}"
+        )
+
+    # Children sharing a tag become a list, as in parse_xml_to_dict
+    grouped: dict[str, list[str]] = {}
+    leaf_tags = set()
+    for child, child_var in zip(children, child_vars):
+        value = _emit_element(child, child_var, lines, ids)
+        if child.tag not in grouped and not len(child) and not child.attrib:
+            leaf_tags.add(child.tag)
+        grouped.setdefault(child.tag, []).append(value)
+
+    for tag, values in grouped.items():
+        if len(values) == 1:
+            value = values[0]
+        elif tag in leaf_tags:
+            # A first value parsed as a list is extended, not wrapped
+            first, rest = f"v{next(ids)}", ", ".join(values[1:])
+            lines.append(f"{first} = {values[0]}")
+            value = (
+                f"([*{first}, {rest}] if isinstance({first}, list)"
+                f" else [{first}, {rest}])"
+            )
+        else:
+            value = f"[{', '.join(values)}]"
+        items.append(f"{tag!r}: {value}")
+
+    result = f"d{next(ids)}"
+    lines.append(f"{result} = {{{', '.join(items)}}}")
+    lines.append(f"if {var}.text and {var}.text.strip():")
+    lines.append(f"    {result}['#text'] = parse_type({var}.text)")
+    return result
+
+
+# Characters a finite decimal number can start with
+_NUMBER_START = frozenset("0123456789+-.")
+
+
+def _to_float(text: str) -> float | None:
+    """
+    Convert a string to a finite float.
+
+    Args:
+    text (str): The string to convert.
+
+    Returns:
+    float | None: The value, or None if the string is not a finite decimal number.
+    """
+    stripped = text.strip()
+    # Cheap rejection of words, underscores and empty strings before float()
+    if not stripped or stripped[0] not in _NUMBER_START or "_" in stripped:
+        return None
+    try:
+        value = float(stripped)
+    except ValueError:
+        return None
+    # nan and inf are not accepted, "-inf" passes the first character check
+    return value if math.isfinite(value) else None
+
+
 def is_float(text: str) -> bool:
     """
     Check if a given string represents a float.
@@ -70,11 +266,7 @@ def is_float(text: str) -> bool:
     Returns:
     bool: True if the string can be converted to a float, False otherwise.
     """
-    # Check for a single period in the text
-    if text.count(".") not in [0, 1]:
-        return False
-
-    return text.replace(" ", "").replace(".", "").replace("-", "").isnumeric()
+    return isinstance(text, str) and _to_float(text) is not None
 
 
 def parse_type(text: str) -> Union[str, float, bool, list, dict]:
@@ -88,19 +280,21 @@ def parse_type(text: str) -> Union[str, float, bool, list, dict]:
     Union[str, float, bool, list]: The parsed data in its appropriate type.
     """
     if isinstance(text, str):
-        if text.lower() == "true":
+        lowered = text.lower()
+        if lowered == "true":
             return True
 
-        if text.lower() == "false":
+        if lowered == "false":
             return False
 
-        if is_float(text):
-            return float(text)
+        value = _to_float(text)
+        if value is not None:
+            return value
 
         if "," in text:
-            vector = text.split(",")
-            if all(is_float(n) for n in vector):
-                return [float(n) for n in vector]
+            vector = [_to_float(n) for n in text.split(",")]
+            if None not in vector:
+                return vector
     return text
 
 
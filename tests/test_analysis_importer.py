@@ -0,0 +1,101 @@
+import numpy as np
+
+from src.aerodynamics.analisis_importer import (
+    OpPoint,
+    SpanDistribution,
+    calculate_distribution_forces,
+)
+
+HEADERS = ["y-span", "Chord", "Ai", "Cl", "PCd", "ICd", "CmGeom", "XCP", "BM"]
+
+
+def write_op_point_file(path, tables: dict[str, np.ndarray]):
+    """Writes a minimal XFLR5 operating point export with the given tables"""
+    lines = [
+        "xflr5 v6.47\n",
+        "\n",
+        "Mobula\n",
+        "T1-16.0 m/s-VLM2\n",
+        "QInf =    16.0000 m/s\n",
+        "Alpha =    2.000°   Beta =   0.000°   Phi =   0.000°   Ctrl =   0.000\n",
+        "\n",
+    ]
+    for name, data in tables.items():
+        lines.append(name + "\n")
+        lines.append("  ".join(HEADERS) + "\n")
+        lines.extend("  ".join(f"{v:11.5f}" for v in row) + "\n" for row in data)
+        lines.append("\n")
+
+    path.write_text("".join(lines), encoding="utf-8")
+
+
+def test_batched_forces_match_strip_formulas(tmp_path):
+    """Test the batched force calculation against the strip force formulas"""
+
+    rng = np.random.default_rng(0)
+    tables = {}
+    for name, n, y_min in [
+        ("Main Wing", 24, -1.6),
+        ("Elevator", 12, -0.4),
+        ("Fin", 7, 0),
+    ]:
+        data = rng.random((n, len(HEADERS)))
+        data[:, 0] = np.linspace(y_min, abs(y_min) or 0.3, n)
+        # Keep the values exactly as they are written to the file
+        tables[name] = np.array([[float(f"{v:.5f}") for v in row] for row in data])
+
+    op_point_file = tmp_path / "op_point.txt"
+    write_op_point_file(op_point_file, tables)
+
+    op_point = OpPoint()
+    op_point.read_file(op_point_file)
+
+    assert [d.name for d in op_point.distributions] == list(tables)
+
+    q = 0.5 * 1.225 * 16.0**2
+    for distribution, data in zip(op_point.distributions, tables.values()):
+        y, chord, _, cl, pcd, icd = data[:, :6].T
+        positive = y >= 0
+        first = np.flatnonzero(positive)[0]
+
+        df = distribution.df
+        assert list(df.columns[: len(HEADERS)]) == HEADERS
+        np.testing.assert_array_equal(df["y-span"], y[positive])
+
+        # Strip width from the previous station, none for the first station
+        dy = df["dy"].to_numpy()
+        if first == 0:
+            assert np.isnan(dy[0])
+        else:
+            assert y[first - 1] < 0
+            np.testing.assert_allclose(dy[0], y[first] - y[first - 1], rtol=1e-12)
+        np.testing.assert_allclose(dy[1:], np.diff(y[positive]), rtol=1e-12)
+
+        cd = pcd[positive] + icd[positive]
+        dA = dy * chord[positive]
+        np.testing.assert_allclose(df["Cd"], cd, rtol=1e-12)
+        np.testing.assert_allclose(df["dA"], dA, rtol=1e-12)
+        np.testing.assert_allclose(df["dL"], q * dA * cl[positive], rtol=1e-12)
+        np.testing.assert_allclose(df["dD"], q * dA * cd, rtol=1e-12)
+        np.testing.assert_allclose(df["dM"], q * dA * chord[positive], rtol=1e-12)
+
+
+def test_batched_forces_empty_distribution():
+    """Test distributions without stations in the batched force calculation"""
+
+    def distribution(name: str, y: list[float]) -> SpanDistribution:
+        ones = np.ones(len(y))
+        return SpanDistribution(name, np.array(y, dtype=float), ones, ones, ones, ones)
+
+    distributions = [
+        distribution("Empty", []),
+        distribution("Main Wing", [-1.0, -0.5, 0.0, 0.5, 1.0]),
+        distribution("Empty", []),
+        distribution("Fin", [0.0, 0.25]),
+        distribution("Empty", []),
+    ]
+    calculate_distribution_forces(distributions)
+
+    assert [len(d.dy) for d in distributions] == [0, 3, 0, 2, 0]
+    np.testing.assert_array_equal(distributions[1].dy, [0.5, 0.5, 0.5])
+    np.testing.assert_array_equal(distributions[3].dy, [np.nan, 0.25])
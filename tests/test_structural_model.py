@@ -0,0 +1,78 @@
+from types import SimpleNamespace
+
+import numpy as np
+
+from src.aerodynamics.data_structures import PointMass, SurfaceType
+from src.geometry.spatial_array import SpatialArray
+from src.structures.structural_model import SurfaceStructure
+
+
+def section_surface(wingspans: list[float]) -> SimpleNamespace:
+    """Surface stand-in with 1 x 0.1 rectangular sections at the given wingspans"""
+    x = np.array([0.0, 1.0, 1.0, 0.0])
+    z = np.array([0.0, 0.0, 0.1, 0.1])
+    curves = [
+        SimpleNamespace(data=np.column_stack([x, np.full_like(x, y), z]))
+        for y in wingspans
+    ]
+    return SimpleNamespace(
+        name="Wing",
+        wingspans=np.array(wingspans),
+        curves=curves,
+        surface_type=SurfaceType.MAINWING,
+    )
+
+
+def test_calculate_ribs_positions():
+    """Test rib positions with uneven section spacing and a zero-length section"""
+
+    surface = section_surface([0.0, 0.25, 0.25, 1.0])
+    ribs = SurfaceStructure.calculate_ribs(surface, material=None, max_spacing=0.1)
+    positions = np.array([rib.curve.y[0] for rib in ribs])
+
+    # ceil(0.25 / 0.1) = 3 ribs in the first section, none in the zero-length
+    # one and ceil(0.75 / 0.1) = 8 in the last one, plus the wing tip
+    expected = np.concatenate(
+        [0.25 / 3 * np.arange(3), 0.25 + 0.75 / 8 * np.arange(8), [1.0]]
+    )
+    np.testing.assert_allclose(positions, expected, rtol=1e-12, atol=1e-15)
+
+    # Every rib takes the shape of the interpolated sections
+    for rib in ribs:
+        np.testing.assert_allclose(rib.curve.x, [0.0, 1.0, 1.0, 0.0])
+    assert [rib.curve.name for rib in ribs[:2]] == ["M_rib_0", "M_rib_1"]
+
+
+def test_surface_mass_updates_after_adding_components():
+    """Test the cached surface mass is recomputed when a component is added"""
+
+    surface = section_surface([0.0, 1.0])
+    balsa = SimpleNamespace(density=160.0)
+    ribs = SurfaceStructure.calculate_ribs(
+        surface, material=balsa, max_spacing=0.5, thickness=0.003
+    )
+    rib_mass = 0.1 * 0.003 * 160.0
+
+    structure = SurfaceStructure(surface, config={})
+    structure.add_rib(ribs[0])
+    structure.add_rib(ribs[1])
+    mass = structure.mass
+    np.testing.assert_allclose(mass.mass, 2 * rib_mass)
+    np.testing.assert_allclose(mass.coordinates, [0.5, 0.25, 0.05])
+    assert structure.mass is mass
+
+    structure.add_rib(ribs[2])
+    np.testing.assert_allclose(structure.mass.mass, 3 * rib_mass)
+    np.testing.assert_allclose(structure.mass.coordinates, [0.5, 0.5, 0.05])
+
+    # Spars and coatings only need their point mass here
+    def component(mass: float, y: float) -> SimpleNamespace:
+        return SimpleNamespace(mass=PointMass(mass, SpatialArray([0.5, y, 0.05]), ""))
+
+    structure.add_spar(component(3 * rib_mass, 1.0))
+    np.testing.assert_allclose(structure.mass.mass, 6 * rib_mass)
+    np.testing.assert_allclose(structure.mass.coordinates, [0.5, 0.75, 0.05])
+
+    structure.add_coating(component(6 * rib_mass, 0.0))
+    np.testing.assert_allclose(structure.mass.mass, 12 * rib_mass)
+    np.testing.assert_allclose(structure.mass.coordinates, [0.5, 0.375, 0.05])
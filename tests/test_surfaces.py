@@ -0,0 +1,32 @@
+import numpy as np
+
+from src.geometry.surfaces import surface_centroid_area
+
+
+def test_centroid_area_planar_grid():
+    """Test the centroid and area of flat rectangular grids"""
+
+    xx, yy = np.meshgrid(np.linspace(0, 1, 5), np.linspace(0, 1, 4))
+    centroid, area = surface_centroid_area(xx, yy, np.zeros_like(xx))
+
+    np.testing.assert_allclose(area, 1.0, rtol=1e-12)
+    np.testing.assert_allclose(centroid, [0.5, 0.5, 0.0], rtol=1e-12, atol=1e-15)
+
+    # Uneven spacing on a 2 x 1 rectangle
+    xx, yy = np.meshgrid([0.0, 0.1, 0.5, 1.7, 2.0], [0.0, 0.8, 1.0])
+    centroid, area = surface_centroid_area(xx, yy, np.zeros_like(xx))
+
+    np.testing.assert_allclose(area, 2.0, rtol=1e-12)
+    np.testing.assert_allclose(centroid, [1.0, 0.5, 0.0], rtol=1e-12, atol=1e-15)
+
+
+def test_centroid_area_folded_grid():
+    """Test the centroid and area of a grid folded into two 45° planes"""
+
+    xx, yy = np.meshgrid(np.linspace(0, 1, 7), np.linspace(0, 1, 3))
+    zz = 0.5 - np.abs(xx - 0.5)
+    centroid, area = surface_centroid_area(xx, yy, zz)
+
+    # Two sqrt(2) / 2 x 1 faces, the mean height of each face is 0.25
+    np.testing.assert_allclose(area, np.sqrt(2), rtol=1e-12)
+    np.testing.assert_allclose(centroid, [0.5, 0.5, 0.25], rtol=1e-12)
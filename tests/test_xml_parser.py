@@ -1,4 +1,13 @@
-from src.utils.xml_parser import is_float, parse_type, parse_xml_file
+import xml.etree.ElementTree as ET
+
+from src.utils import xml_parser
+from src.utils.xml_parser import (
+    compile_schema,
+    is_float,
+    parse_type,
+    parse_xml_file,
+    parse_xml_to_dict,
+)
 
 
 def test_is_float_cases():
@@ -10,6 +19,11 @@ def test_is_float_cases():
     assert is_float("160") is True
     assert is_float("165.5") is True
     assert is_float("16.5.5.0.1") is False
+    assert is_float("1.5e-05") is True
+    assert is_float("1-2") is False
+    assert is_float("nan") is False
+    assert is_float("-inf") is False
+    assert is_float("1_0") is False
 
 
 def test_parse_type():
@@ -20,3 +34,65 @@ def test_parse_type():
     assert isinstance(parse_type("160.5"), float)
     assert isinstance(parse_type("160"), float)
     assert parse_type("      0.193,           0,           0") == [0.193, 0, 0]
+    assert parse_type("1.5e-05") == 1.5e-05
+    assert parse_type("NACA 0009") == "NACA 0009"
+    assert parse_type("nan") == "nan"
+    assert parse_type("Inf") == "Inf"
+    assert parse_type("infinity") == "infinity"
+    assert parse_type("1_0") == "1_0"
+    assert parse_type("1, nan") == "1, nan"
+
+
+def test_parse_xml_file():
+    """Test parse_xml_file against parsing the element tree directly"""
+
+    for path in (
+        "data/xml/Mobula.xml",
+        "data/materials/xml_libraries/Materiales_Engineering_Data.xml",
+    ):
+        root = ET.parse(path).getroot()
+        assert parse_xml_file(path) == parse_xml_to_dict(root)
+
+
+def test_parse_xml_with_schema(monkeypatch):
+    """Test the compiled schema parser against the generic parser"""
+
+    # Start from an empty cache, independent of the other tests
+    monkeypatch.setattr(xml_parser, "_SCHEMA_PARSERS", {})
+    monkeypatch.setattr(xml_parser, "_SEEN_SCHEMAS", {})
+
+    mobula = parse_xml_file("data/xml/Mobula.xml")
+    sample = parse_xml_file("data/xml/test_sample.xml")
+
+    # First sighting only records the schema, the second one compiles it
+    assert parse_xml_file("data/xml/Mobula.xml", specialize=True) == mobula
+    assert not xml_parser._SCHEMA_PARSERS["explane"]
+    assert parse_xml_file("data/xml/Mobula.xml", specialize=True) == mobula
+    assert len(xml_parser._SCHEMA_PARSERS["explane"]) == 1
+    # Third call uses the compiled parser
+    assert parse_xml_file("data/xml/Mobula.xml", specialize=True) == mobula
+
+    # Same root tag with a different structure falls back to the generic parser
+    assert parse_xml_file("data/xml/test_sample.xml", specialize=True) == sample
+    assert len(xml_parser._SCHEMA_PARSERS["explane"]) == 1
+
+    # Alternating between both schemas reuses the parsers compiled for each one
+    for _ in range(3):
+        assert parse_xml_file("data/xml/Mobula.xml", specialize=True) == mobula
+        assert parse_xml_file("data/xml/test_sample.xml", specialize=True) == sample
+    assert len(xml_parser._SCHEMA_PARSERS["explane"]) == 2
+
+
+def test_compiled_schema_repeated_tags():
+    """Test the compiled parser merges repeated tags like the generic parser"""
+
+    cases = [
+        # A first value parsed as a comma vector is extended by the next ones
+        "<q><p>1,2,3</p><p>4</p></q>",
+        "<q><p>4</p><p>1,2,3</p><p>5</p></q>",
+        "<q><p a='1'>1,2</p><p a='2'>4</p></q>",
+        "<q><p><r>1</r></p><p><r>2</r></p></q>",
+    ]
+    for case in cases:
+        element = ET.fromstring(case)
+        assert compile_schema(element)(element) == parse_xml_to_dict(element), case